@@ -89,7 +89,11 @@ async def async_unload_entry(hass, entry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+
+        # Flush any delayed save now, so a reload reads up-to-date data from disk
+        storage_manager: KidsChoresStorageManager = entry_data["storage_manager"]
+        await storage_manager.async_save()
 
         # Await service unloading
         await async_unload_services(hass)
@@ -7,6 +7,8 @@ from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    CONF_DAYS,
+    CUSTOM_INTERVAL_UNIT_DAYS,
     DOMAIN,
     FREQUENCY_BIWEEKLY,
     FREQUENCY_CUSTOM,
@@ -238,15 +240,10 @@ class KidsChoresCalendarEntity(CalendarEntity):
 
             elif recurring == FREQUENCY_CUSTOM:
                 interval = chore.get("custom_interval", 1)
-                unit = chore.get("custom_interval_unit", "days")
-                if unit == "days":
-                    start_event = due_dt - datetime.timedelta(days=interval)
-                elif unit == "weeks":
-                    start_event = due_dt - datetime.timedelta(weeks=interval)
-                elif unit == "months":
-                    start_event = due_dt - datetime.timedelta(days=30 * interval)
-                else:
-                    start_event = due_dt
+                unit = chore.get("custom_interval_unit", CONF_DAYS)
+                start_event = due_dt - datetime.timedelta(
+                    days=interval * CUSTOM_INTERVAL_UNIT_DAYS.get(unit, 0)
+                )
 
                 if start_event < window_end and due_dt > window_start:
                     e = CalendarEvent(
@@ -328,15 +325,10 @@ class KidsChoresCalendarEntity(CalendarEntity):
 
         if recurring == FREQUENCY_CUSTOM:
             interval = chore.get("custom_interval", 1)
-            unit = chore.get("custom_interval_unit", "days")
-            if unit == "days":
-                step = datetime.timedelta(days=interval)
-            elif unit == "weeks":
-                step = datetime.timedelta(weeks=interval)
-            elif unit == "months":
-                step = datetime.timedelta(days=30 * interval)
-            else:
-                step = datetime.timedelta(days=interval)
+            unit = chore.get("custom_interval_unit", CONF_DAYS)
+            step = datetime.timedelta(
+                days=interval * CUSTOM_INTERVAL_UNIT_DAYS.get(unit, 1)
+            )
 
             current = gen_start
             while current <= cutoff:
@@ -8,6 +8,7 @@ services, and options flow.
 """
 
 import logging
+from typing import Final
 
 from homeassistant.const import Platform
 
@@ -27,6 +28,10 @@ PLATFORMS = [
 # Storage and Versioning
 STORAGE_KEY = "kidschores_data"  # Persistent storage key
 STORAGE_VERSION = 1  # Storage version
+# Version of the data migrations applied to stored data. Any change to the shape of
+# stored data must bump this and add the matching migration to the coordinator.
+SCHEMA_VERSION = 1
+STORAGE_SAVE_DELAY = 1  # Seconds to coalesce storage writes
 
 # Update Interval
 UPDATE_INTERVAL = 5  # Update interval for coordinator (in minutes)
@@ -150,6 +155,19 @@ FREQUENCY_MONTHLY = "monthly"
 FREQUENCY_NONE = "none"
 FREQUENCY_WEEKLY = "weekly"
 
+# Custom Interval Units
+CONF_EMPTY = ""
+CONF_DAYS = "days"
+CONF_WEEKS = "weeks"
+CONF_MONTHS = "months"
+CUSTOM_INTERVAL_UNIT_OPTIONS = (CONF_EMPTY, CONF_DAYS, CONF_WEEKS, CONF_MONTHS)
+CUSTOM_INTERVAL_UNITS = frozenset((CONF_DAYS, CONF_WEEKS, CONF_MONTHS))
+CUSTOM_INTERVAL_UNIT_DAYS = {  # Approximate length of each unit in days
+    CONF_DAYS: 1,
+    CONF_WEEKS: 7,
+    CONF_MONTHS: 30,
+}
+
 # -------------------- Data Keys --------------------
 # Data Keys for Coordinator and Storage
 DATA_ACHIEVEMENTS = "achievements"  # Key for storing achievements data
@@ -162,6 +180,7 @@ DATA_PENDING_CHORE_APPROVALS = "pending_chore_approvals"  # Pending chore approv
 DATA_PENDING_REWARD_APPROVALS = "pending_reward_approvals"  # Pending reward approvals
 DATA_PENALTIES = "penalties"  # Key for storing penalties data
 DATA_REWARDS = "rewards"  # Key for storing rewards data
+DATA_SCHEMA_VERSION = "schema_version"  # Key for the applied migrations version
 DATA_BONUSES = "bonuses"  # Key for storing bonuses data
 
 # -------------------- States --------------------
@@ -182,6 +201,14 @@ CHORE_STATE_PARTIAL = "partial"  # Chore approved with partial points
 CHORE_STATE_PENDING = "pending"  # Default state: chore pending approval
 CHORE_STATE_UNKNOWN = "unknown"  # Unknown chore state
 
+# Per-kid chore states tracked by the chore status count sensors
+CHORE_STATES_TRACKED = (
+    CHORE_STATE_PENDING,
+    CHORE_STATE_CLAIMED,
+    CHORE_STATE_APPROVED,
+    CHORE_STATE_OVERDUE,
+)
+
 
 # Reward States
 REWARD_STATE_APPROVED = "approved"  # Reward fully approved
@@ -207,6 +234,18 @@ ACTION_APPROVE_REWARD = "APPROVE_REWARD"
 ACTION_DISAPPROVE_REWARD = "DISAPPROVE_REWARD"
 ACTION_REMIND_30 = "REMIND_30"
 
+# Actions offered on approval notifications, as (action identifier, title) pairs
+CHORE_APPROVAL_ACTIONS = (
+    (ACTION_APPROVE_CHORE, ACTION_TITLE_APPROVE),
+    (ACTION_DISAPPROVE_CHORE, ACTION_TITLE_DISAPPROVE),
+    (ACTION_REMIND_30, ACTION_TITLE_REMIND_30),
+)
+REWARD_APPROVAL_ACTIONS = (
+    (ACTION_APPROVE_REWARD, ACTION_TITLE_APPROVE),
+    (ACTION_DISAPPROVE_REWARD, ACTION_TITLE_DISAPPROVE),
+    (ACTION_REMIND_30, ACTION_TITLE_REMIND_30),
+)
+
 # -------------------- Sensors --------------------
 # Sensor Attributes
 ATTR_ACHIEVEMENT_NAME = "achievement_name"
@@ -225,7 +264,8 @@ ATTR_CHORE_CLAIMS_COUNT = "chore_claims_count"
 ATTR_CHORE_CURRENT_STREAK = "chore_current_streak"
 ATTR_CHORE_HIGHEST_STREAK = "chore_highest_streak"
 ATTR_CHORE_NAME = "chore_name"
-ATTR_CLAIMED_ON = "Claimed on"
+ATTR_CHORES = "chores"
+ATTR_CLAIMED_ON = "claimed_on"
 ATTR_COST = "cost"
 ATTR_CRITERIA = "criteria"
 ATTR_CUSTOM_FREQUENCY_INTERVAL = "custom_frequency_interval"
@@ -249,7 +289,7 @@ ATTR_POINTS_TO_NEXT_BADGE = "points_to_next_badge"
 ATTR_RAW_PROGRESS = "raw_progress"
 ATTR_RAW_STREAK = "raw_streak"
 ATTR_RECURRING_FREQUENCY = "recurring_frequency"
-ATTR_REDEEMED_ON = "Redeemed on"
+ATTR_REDEEMED_ON = "redeemed_on"
 ATTR_REWARD_APPROVALS_COUNT = "reward_approvals_count"
 ATTR_REWARD_CLAIMS_COUNT = "reward_claims_count"
 ATTR_REWARD_NAME = "reward_name"
@@ -331,10 +371,14 @@ FIELD_BONUS_NAME = "bonus_name"
 # -------------------- Labels --------------------
 # Labels for Sensors and UI
 LABEL_BADGES = "Badges"
+# Former pending approval attribute keys (now ATTR_CLAIMED_ON / ATTR_REDEEMED_ON);
+# still published alongside the new keys for one release, then removed
+LABEL_CLAIMED_ON = "Claimed on"
 LABEL_COMPLETED_DAILY = "Daily Completed Chores"
 LABEL_COMPLETED_MONTHLY = "Monthly Completed Chores"
 LABEL_COMPLETED_WEEKLY = "Weekly Completed Chores"
 LABEL_POINTS = "Points"
+LABEL_REDEEMED_ON = "Redeemed on"
 
 # -------------------- Buttons --------------------
 # Button Prefixes for Dynamic Creation
@@ -378,8 +422,8 @@ UNKNOWN_KID = "Unknown Kid"  # Error for unknown kid
 UNKNOWN_REWARD = "Unknown Reward"  # Error for unknown reward
 
 # -------------------- Parent Approval Workflow --------------------
-PARENT_APPROVAL_REQUIRED = True  # Enable parent approval for certain actions
-HA_USERNAME_LINK_ENABLED = True  # Enable linking kids to HA usernames
+PARENT_APPROVAL_REQUIRED: Final = True  # Enable parent approval for certain actions
+HA_USERNAME_LINK_ENABLED: Final = True  # Enable linking kids to HA usernames
 
 
 # ---------------------------- Weekdays -----------------------------
@@ -9,7 +9,8 @@ Manages entities primarily using internal_id for consistency.
 import asyncio
 import uuid
 from calendar import monthrange
-from datetime import datetime, timedelta
+from collections.abc import Coroutine
+from datetime import datetime, timedelta, tzinfo
 from typing import Any, Optional
 
 from homeassistant.auth.models import User
@@ -26,18 +27,11 @@ from .const import (
     ACHIEVEMENT_TYPE_DAILY_MIN,
     ACHIEVEMENT_TYPE_STREAK,
     ACHIEVEMENT_TYPE_TOTAL,
-    ACTION_APPROVE_CHORE,
-    ACTION_APPROVE_REWARD,
-    ACTION_DISAPPROVE_CHORE,
-    ACTION_DISAPPROVE_REWARD,
-    ACTION_REMIND_30,
-    ACTION_TITLE_APPROVE,
-    ACTION_TITLE_DISAPPROVE,
-    ACTION_TITLE_REMIND_30,
     BADGE_THRESHOLD_TYPE_CHORE_COUNT,
     BADGE_THRESHOLD_TYPE_POINTS,
     CHALLENGE_TYPE_DAILY_MIN,
     CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
+    CHORE_APPROVAL_ACTIONS,
     CHORE_STATE_APPROVED,
     CHORE_STATE_APPROVED_IN_PART,
     CHORE_STATE_CLAIMED,
@@ -47,6 +41,7 @@ from .const import (
     CHORE_STATE_PARTIAL,
     CHORE_STATE_PENDING,
     CHORE_STATE_UNKNOWN,
+    CHORE_STATES_TRACKED,
     CONF_ACHIEVEMENTS,
     CONF_APPLICABLE_DAYS,
     CONF_BADGES,
@@ -63,6 +58,9 @@ from .const import (
     CONF_PENALTIES,
     CONF_REWARDS,
     CONF_BONUSES,
+    CONF_MONTHS,
+    CUSTOM_INTERVAL_UNIT_DAYS,
+    CUSTOM_INTERVAL_UNITS,
     DATA_ACHIEVEMENTS,
     DATA_BADGES,
     DATA_CHALLENGES,
@@ -73,6 +71,7 @@ from .const import (
     DATA_PENDING_REWARD_APPROVALS,
     DATA_PENALTIES,
     DATA_REWARDS,
+    DATA_SCHEMA_VERSION,
     DATA_BONUSES,
     DEFAULT_APPLICABLE_DAYS,
     DEFAULT_BADGE_THRESHOLD,
@@ -101,12 +100,14 @@ from .const import (
     FREQUENCY_NONE,
     FREQUENCY_WEEKLY,
     LOGGER,
+    REWARD_APPROVAL_ACTIONS,
+    SCHEMA_VERSION,
     UPDATE_INTERVAL,
     WEEKDAY_OPTIONS,
 )
 
 from .storage_manager import KidsChoresStorageManager
-from .notification_helper import async_send_notification
+from .notification_helper import async_send_notification, build_approval_actions
 
 
 class KidsChoresDataCoordinator(DataUpdateCoordinator):
@@ -127,33 +128,48 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             LOGGER,
             name=f"{DOMAIN}_coordinator",
             update_interval=timedelta(minutes=UPDATE_INTERVAL),
+            always_update=False,
         )
         self.config_entry = config_entry
         self.storage_manager = storage_manager
         self._data: dict[str, Any] = {}
+        self._ensure_minimal_structure()
+        self._challenge_windows: dict[str, tuple] = {}
+        self._kid_chores_by_state: dict[str, dict[str, list[str]]] = {}
+        self._streak_achievements_by_chore: dict[str, list[str]] = {}
+        self._window_challenge_ids: list[str] = []
+        self._daily_min_challenges_by_kid_chore: dict[tuple[str, str], list[str]] = {}
 
     # -------------------------------------------------------------------------------------
     # Migrate Data and Converters
     # -------------------------------------------------------------------------------------
 
-    def _migrate_datetime(self, dt_str: str) -> str:
-        """Convert a datetime string to a UTC-aware ISO string."""
+    def _migrate_datetime(self, dt_str: str, local_tz: tzinfo) -> str:
+        """Convert a datetime string to a UTC-aware ISO string.
+
+        Naive values are assumed to be in local_tz, which callers resolve once per
+        migration pass rather than once per field.
+        """
         if not isinstance(dt_str, str):
             return dt_str
 
         try:
-            # Try to parse using Home Assistant’s utility first:
-            dt_obj = dt_util.parse_datetime(dt_str)
-            if dt_obj is None:
-                # Fallback using fromisoformat
+            try:
+                # Stored values are normally ISO strings, so try the fast parser first
                 dt_obj = datetime.fromisoformat(dt_str)
+            except ValueError:
+                # Fallback using Home Assistant’s (regex based) utility
+                dt_obj = dt_util.parse_datetime(dt_str)
+                if dt_obj is None:
+                    raise
             # If naive, assume local time and make it aware:
             if dt_obj.tzinfo is None:
-                dt_obj = dt_obj.replace(
-                    tzinfo=dt_util.get_time_zone(self.hass.config.time_zone)
-                )
+                dt_obj = dt_obj.replace(tzinfo=local_tz)
+            elif dt_obj.utcoffset() == timedelta(0):
+                # Already UTC (the common case for stored data)
+                return dt_obj.isoformat()
             # Convert to UTC
-            dt_obj_utc = dt_util.as_utc(dt_obj)
+            dt_obj_utc = dt_obj.astimezone(dt_util.UTC)
             return dt_obj_utc.isoformat()
         except Exception as err:
             LOGGER.warning("Error migrating datetime '%s': %s", dt_str, err)
@@ -161,23 +177,31 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
     def _migrate_stored_datetimes(self):
         """Walk through stored data and convert known datetime fields to UTC-aware ISO strings."""
+        local_tz = dt_util.get_time_zone(self.hass.config.time_zone)
+
         # For each chore, migrate due_date, last_completed, and last_claimed
         for chore in self._data.get(DATA_CHORES, {}).values():
             if chore.get("due_date"):
-                chore["due_date"] = self._migrate_datetime(chore["due_date"])
+                chore["due_date"] = self._migrate_datetime(chore["due_date"], local_tz)
             if chore.get("last_completed"):
                 chore["last_completed"] = self._migrate_datetime(
-                    chore["last_completed"]
+                    chore["last_completed"], local_tz
                 )
             if chore.get("last_claimed"):
-                chore["last_claimed"] = self._migrate_datetime(chore["last_claimed"])
+                chore["last_claimed"] = self._migrate_datetime(
+                    chore["last_claimed"], local_tz
+                )
         # Also, migrate timestamps in pending approvals
         for approval in self._data.get(DATA_PENDING_CHORE_APPROVALS, []):
             if approval.get("timestamp"):
-                approval["timestamp"] = self._migrate_datetime(approval["timestamp"])
+                approval["timestamp"] = self._migrate_datetime(
+                    approval["timestamp"], local_tz
+                )
         for approval in self._data.get(DATA_PENDING_REWARD_APPROVALS, []):
             if approval.get("timestamp"):
-                approval["timestamp"] = self._migrate_datetime(approval["timestamp"])
+                approval["timestamp"] = self._migrate_datetime(
+                    approval["timestamp"], local_tz
+                )
 
         # Migrate datetime on Challenges
         for challenge in self._data.get(DATA_CHALLENGES, {}).values():
@@ -185,13 +209,13 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             if not isinstance(start_date, str) or not start_date.strip():
                 challenge["start_date"] = None
             else:
-                challenge["start_date"] = self._migrate_datetime(start_date)
+                challenge["start_date"] = self._migrate_datetime(start_date, local_tz)
 
             end_date = challenge.get("end_date")
             if not isinstance(end_date, str) or not end_date.strip():
                 challenge["end_date"] = None
             else:
-                challenge["end_date"] = self._migrate_datetime(end_date)
+                challenge["end_date"] = self._migrate_datetime(end_date, local_tz)
 
     def _migrate_chore_data(self):
         """Migrate each chore's data to include new fields if missing.
@@ -226,6 +250,14 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             if not isinstance(kid_info.get(key), list):
                 kid_info[key] = []
 
+    def _remove_chore_from_kid_list(
+        self, kid_info: dict[str, Any], key: str, chore_id: str
+    ) -> None:
+        """Remove every occurrence of a chore from a kid's chore list, in place."""
+        chore_list = kid_info[key]
+        while chore_id in chore_list:
+            chore_list.remove(chore_id)
+
     # -------------------------------------------------------------------------------------
     # Periodic + First Refresh
     # -------------------------------------------------------------------------------------
@@ -236,24 +268,35 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             # Check overdue chores
             await self._check_overdue_chores()
 
-            # Notify entities of changes
+            # The data dict is updated in place, so the base class cannot detect
+            # changes by comparison; always notify entities once per tick so that
+            # in-place changes made outside the action paths reach them too.
             self.async_update_listeners()
 
             return self._data
         except Exception as err:
             raise UpdateFailed(f"Error updating KidsChores data: {err}") from err
 
+    def async_update_listeners(self) -> None:
+        """Drop the per-update caches, then notify entities of new data."""
+        self._kid_chores_by_state.clear()
+        super().async_update_listeners()
+
     async def async_config_entry_first_refresh(self):
         """Load from storage and merge config options."""
         stored_data = self.storage_manager.get_data()
+        stored_version = (stored_data or {}).get(DATA_SCHEMA_VERSION, 0)
+        needs_migration = stored_version < SCHEMA_VERSION
         if stored_data:
             self._data = stored_data
 
-            # Migrate any datetime fields in stored data to UTC-aware strings
-            self._migrate_stored_datetimes()
+            # Migrations only need to run once; skip them if already applied
+            if needs_migration:
+                # Migrate any datetime fields in stored data to UTC-aware strings
+                self._migrate_stored_datetimes()
 
-            # Migrate chore data and add new fields
-            self._migrate_chore_data()
+                # Migrate chore data and add new fields
+                self._migrate_chore_data()
 
         else:
             self._data = {
@@ -270,10 +313,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 DATA_PENDING_REWARD_APPROVALS: [],
             }
 
-        if not isinstance(self._data.get(DATA_PENDING_CHORE_APPROVALS), list):
-            self._data[DATA_PENDING_CHORE_APPROVALS] = []
-        if not isinstance(self._data.get(DATA_PENDING_REWARD_APPROVALS), list):
-            self._data[DATA_PENDING_REWARD_APPROVALS] = []
+        # Fill in missing sections and rebind the data attributes to the new dict
+        self._ensure_minimal_structure()
 
         # Register daily/weekly/monthly resets
         async_track_time_change(
@@ -283,10 +324,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         # Merge config entry data (options) into the stored data
         self._initialize_data_from_config()
 
-        # Normalize all kids list fields
-        for kid in self._data.get(DATA_KIDS, {}).values():
-            self._normalize_kid_lists(kid)
-
+        self._data[DATA_SCHEMA_VERSION] = SCHEMA_VERSION
         self._persist()
         await super().async_config_entry_first_refresh()
 
@@ -326,6 +364,47 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         # Recalculate Badges on reload
         self._recalculate_all_badges()
 
+        # Index achievements and challenges by the chore they track
+        self._index_chore_trackers()
+
+        # Remove orphaned shared chore, achievement and challenge sensors once all
+        # sections are synced
+        self.hass.async_create_task(self._remove_orphaned_entities())
+
+    def _index_chore_trackers(self):
+        """Index streak achievements and challenges by the chore they track.
+
+        Achievements and challenges only change through the config entry, so the
+        indexes are rebuilt whenever the options are merged into the data.
+        """
+        self._streak_achievements_by_chore = {}
+        for achievement_id, achievement in self.achievements_data.items():
+            if achievement.get("type") == ACHIEVEMENT_TYPE_STREAK:
+                self._streak_achievements_by_chore.setdefault(
+                    achievement.get("selected_chore_id"), []
+                ).append(achievement_id)
+
+        self._window_challenge_ids = []
+        self._daily_min_challenges_by_kid_chore = {}
+        for challenge_id, challenge in self.challenges_data.items():
+            if challenge.get("type") == CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW:
+                # Any approved chore counts towards these
+                self._window_challenge_ids.append(challenge_id)
+            elif challenge.get("type") == CHALLENGE_TYPE_DAILY_MIN:
+                # Only tracked if the challenge is tracking a specific chore.
+                selected_chore = challenge.get("selected_chore_id")
+                if not selected_chore:
+                    LOGGER.warning(
+                        "Challenge '%s' of type daily_min has no selected_chore_id set. Progress will not be tracked.",
+                        challenge.get("name"),
+                    )
+                    continue
+                # Only assigned kids make progress on these
+                for assigned_kid_id in set(challenge.get("assigned_kids", [])):
+                    self._daily_min_challenges_by_kid_chore.setdefault(
+                        (assigned_kid_id, selected_chore), []
+                    ).append(challenge_id)
+
     def _ensure_minimal_structure(self):
         """Ensure that all necessary data sections are present."""
         for key in [
@@ -345,6 +424,24 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             if not isinstance(self._data.get(key), list):
                 self._data[key] = []
 
+        self._bind_data_sections()
+
+    def _bind_data_sections(self):
+        """Point the data attributes at the section dicts of the current data.
+
+        Sections are only ever mutated in place, so this only needs to run again
+        when self._data itself is replaced.
+        """
+        self.kids_data: dict[str, Any] = self._data[DATA_KIDS]
+        self.parents_data: dict[str, Any] = self._data[DATA_PARENTS]
+        self.chores_data: dict[str, Any] = self._data[DATA_CHORES]
+        self.badges_data: dict[str, Any] = self._data[DATA_BADGES]
+        self.rewards_data: dict[str, Any] = self._data[DATA_REWARDS]
+        self.penalties_data: dict[str, Any] = self._data[DATA_PENALTIES]
+        self.achievements_data: dict[str, Any] = self._data[DATA_ACHIEVEMENTS]
+        self.challenges_data: dict[str, Any] = self._data[DATA_CHALLENGES]
+        self.bonuses_data: dict[str, Any] = self._data[DATA_BONUSES]
+
     # -------------------------------------------------------------------------------------
     # Helpers to Sync Entities from config
     # -------------------------------------------------------------------------------------
@@ -415,25 +512,21 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             # Remove entity from data
             del self._data[section][entity_id]
 
-            # Remove entity from HA registry
-            self._remove_entities_in_ha(section, entity_id)
-            if section == DATA_CHORES:
-                for kid_id in self.kids_data.keys():
-                    self._remove_kid_chore_entities(kid_id, entity_id)
-
-            # Perform general clean-up
-            self._cleanup_all_links()
-
-            # Remove deleted kids from parents list
-            self._cleanup_parent_assignments()
-
+        if entities_to_remove:
             # Remove chore approvals on chore delete
-            self._cleanup_pending_chore_approvals()
+            if section == DATA_CHORES:
+                self._cleanup_pending_chore_approvals()
 
             # Remove reward approvals on reward delete
             if section == DATA_REWARDS:
                 self._cleanup_pending_reward_approvals()
 
+            # Perform general clean-up once all deletions are done
+            self._cleanup_all_links(section)
+
+            # Remove entities from HA registry (this also covers kid-specific chore entities)
+            self._remove_entities_in_ha(section, entities_to_remove)
+
         # Add or update entities
         for entity_id, entity_body in config_data.items():
             if entity_id not in self._data[section]:
@@ -441,26 +534,35 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             else:
                 update_method(entity_id, entity_body)
 
-        # Remove orphaned shared chore sensors.
-        if section == DATA_CHORES:
-            self.hass.async_create_task(self._remove_orphaned_shared_chore_sensors())
+    def _cleanup_all_links(self, section: str) -> None:
+        """Run the cross-entity cleanup routines affected by deletions in a section.
+
+        Only kid and chore deletions can leave dangling references behind.
+        """
+        if section == DATA_KIDS:
+            valid_kid_ids = set(self.kids_data)
+            self._cleanup_deleted_kid_references(valid_kid_ids)
+
+            # Remove deleted kids from parents list
+            self._cleanup_parent_assignments(valid_kid_ids)
 
-        # Remove orphaned achievement and challenges sensors
-        self.hass.async_create_task(self._remove_orphaned_achievement_entities())
-        self.hass.async_create_task(self._remove_orphaned_challenge_entities())
+        elif section == DATA_CHORES:
+            valid_chore_ids = set(self.chores_data)
+            self._cleanup_deleted_chore_references(valid_chore_ids)
+            self._cleanup_deleted_chore_in_achievements(valid_chore_ids)
+            self._cleanup_deleted_chore_in_challenges(valid_chore_ids)
 
-    def _cleanup_all_links(self) -> None:
-        """Run all cross-entity cleanup routines."""
-        self._cleanup_deleted_kid_references()
-        self._cleanup_deleted_chore_references()
-        self._cleanup_deleted_chore_in_achievements()
-        self._cleanup_deleted_chore_in_challenges()
+    def _get_entry_registry_entries(self) -> list[er.RegistryEntry]:
+        """Return the entity registry entries that belong to this config entry."""
+        ent_reg = er.async_get(self.hass)
+        return er.async_entries_for_config_entry(ent_reg, self.config_entry.entry_id)
 
-    def _remove_entities_in_ha(self, section: str, item_id: str):
-        """Remove all platform entities whose unique_id references the given item_id."""
+    def _remove_entities_in_ha(self, section: str, item_ids: set[str]):
+        """Remove all platform entities whose unique_id references any of the item_ids."""
         ent_reg = er.async_get(self.hass)
-        for entity_entry in list(ent_reg.entities.values()):
-            if str(item_id) in str(entity_entry.unique_id):
+        for entity_entry in self._get_entry_registry_entries():
+            unique_id = entity_entry.unique_id
+            if any(item_id in unique_id for item_id in item_ids):
                 ent_reg.async_remove(entity_entry.entity_id)
                 LOGGER.debug(
                     "Auto-removed entity '%s' with unique_id '%s' from registry",
@@ -468,18 +570,27 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                     entity_entry.unique_id,
                 )
 
-    async def _remove_orphaned_shared_chore_sensors(self):
-        """Remove SharedChoreGlobalStateSensor entities for chores no longer marked as shared."""
+    async def _remove_orphaned_entities(self) -> None:
+        """Remove orphaned shared chore, achievement and challenge sensors.
+
+        SharedChoreGlobalStateSensor entities are orphaned once their chore is gone or no
+        longer shared; progress sensors once their kid is no longer assigned. All three
+        are handled in a single pass over this entry's registry entries.
+        """
         ent_reg = er.async_get(self.hass)
         prefix = f"{self.config_entry.entry_id}_"
-        suffix = "_global_state"
-        for entity_entry in list(ent_reg.entities.values()):
-            if (
-                entity_entry.domain == "sensor"
-                and entity_entry.unique_id.startswith(prefix)
-                and entity_entry.unique_id.endswith(suffix)
-            ):
-                chore_id = entity_entry.unique_id[len(prefix) : -len(suffix)]
+        shared_chore_suffix = "_global_state"
+        progress_suffixes = {
+            "_achievement_progress": DATA_ACHIEVEMENTS,
+            "_challenge_progress": DATA_CHALLENGES,
+        }
+        for entity_entry in self._get_entry_registry_entries():
+            unique_id = entity_entry.unique_id
+            if entity_entry.domain != "sensor" or not unique_id.startswith(prefix):
+                continue
+
+            if unique_id.endswith(shared_chore_suffix):
+                chore_id = unique_id[len(prefix) : -len(shared_chore_suffix)]
                 chore_info = self.chores_data.get(chore_id)
                 if not chore_info or not chore_info.get("shared_chore", False):
                     ent_reg.async_remove(entity_entry.entity_id)
@@ -487,70 +598,37 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                         "Removed orphaned SharedChoreGlobalStateSensor: %s",
                         entity_entry.entity_id,
                     )
+                continue
 
-    async def _remove_orphaned_achievement_entities(self) -> None:
-        """Remove achievement progress entities for kids that are no longer assigned."""
-        ent_reg = er.async_get(self.hass)
-        prefix = f"{self.config_entry.entry_id}_"
-        suffix = "_achievement_progress"
-        for entity_entry in list(ent_reg.entities.values()):
-            if (
-                entity_entry.domain == "sensor"
-                and entity_entry.unique_id.startswith(prefix)
-                and entity_entry.unique_id.endswith(suffix)
-            ):
-                core_id = entity_entry.unique_id[len(prefix) : -len(suffix)]
-                parts = core_id.split("_", 1)
-                if len(parts) != 2:
+            for suffix, section in progress_suffixes.items():
+                if not unique_id.endswith(suffix):
                     continue
 
-                kid_id, achievement_id = parts
-                achievement = self._data.get(DATA_ACHIEVEMENTS, {}).get(achievement_id)
-                if not achievement or kid_id not in achievement.get(
-                    "assigned_kids", []
-                ):
-                    ent_reg.async_remove(entity_entry.entity_id)
-                    LOGGER.debug(
-                        "Removed orphaned achievement progress sensor '%s' because kid '%s' is not assigned to achievement '%s'",
-                        entity_entry.entity_id,
-                        kid_id,
-                        achievement_id,
-                    )
-
-    async def _remove_orphaned_challenge_entities(self) -> None:
-        """Remove challenge progress sensor entities for kids no longer assigned."""
-        ent_reg = er.async_get(self.hass)
-        prefix = f"{self.config_entry.entry_id}_"
-        suffix = "_challenge_progress"
-        for entity_entry in list(ent_reg.entities.values()):
-            if (
-                entity_entry.domain == "sensor"
-                and entity_entry.unique_id.startswith(prefix)
-                and entity_entry.unique_id.endswith(suffix)
-            ):
-                core_id = entity_entry.unique_id[len(prefix) : -len(suffix)]
+                core_id = unique_id[len(prefix) : -len(suffix)]
                 parts = core_id.split("_", 1)
                 if len(parts) != 2:
-                    continue
+                    break
 
-                kid_id, challenge_id = parts
-                challenge = self._data.get(DATA_CHALLENGES, {}).get(challenge_id)
-                if not challenge or kid_id not in challenge.get("assigned_kids", []):
+                kid_id, item_id = parts
+                item = self._data.get(section, {}).get(item_id)
+                if not item or kid_id not in item.get("assigned_kids", []):
                     ent_reg.async_remove(entity_entry.entity_id)
                     LOGGER.debug(
-                        "Removed orphaned challenge progress sensor '%s' because kid '%s' is not assigned to challenge '%s'",
+                        "Removed orphaned progress sensor '%s' because kid '%s' is not assigned to %s '%s'",
                         entity_entry.entity_id,
                         kid_id,
-                        challenge_id,
+                        section,
+                        item_id,
                     )
+                break
 
     def _remove_kid_chore_entities(self, kid_id: str, chore_id: str) -> None:
         """Remove all kid-specific chore entities for a given kid and chore."""
         ent_reg = er.async_get(self.hass)
-        for entity_entry in list(ent_reg.entities.values()):
-            if (kid_id in entity_entry.unique_id) and (
-                chore_id in entity_entry.unique_id
-            ):
+        # Every kid-specific chore unique_id embeds "<kid_id>_<chore_id>"
+        kid_chore_key = f"{kid_id}_{chore_id}"
+        for entity_entry in self._get_entry_registry_entries():
+            if kid_chore_key in entity_entry.unique_id:
                 ent_reg.async_remove(entity_entry.entity_id)
                 LOGGER.debug(
                     "Removed kid-specific entity '%s' for kid '%s' and chore '%s'",
@@ -568,15 +646,14 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         # Remove from lists if present
         for key in ["claimed_chores", "approved_chores"]:
             if chore_id in kid.get(key, []):
-                kid[key] = [c for c in kid[key] if c != chore_id]
+                self._remove_chore_from_kid_list(kid, key, chore_id)
                 LOGGER.debug(
                     "Removed chore '%s' from kid '%s' list '%s'", chore_id, kid_id, key
                 )
 
         # Remove from dictionary fields if present
         for dict_key in ["chore_claims", "chore_approvals"]:
-            if chore_id in kid.get(dict_key, {}):
-                kid[dict_key].pop(chore_id)
+            if kid.get(dict_key, {}).pop(chore_id, None) is not None:
                 LOGGER.debug(
                     "Removed chore '%s' from kid '%s' dict '%s'",
                     chore_id,
@@ -585,48 +662,75 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 )
 
         # Remove from chore streaks if present
-        if "chore_streaks" in kid and chore_id in kid["chore_streaks"]:
-            kid["chore_streaks"].pop(chore_id)
+        if kid.get("chore_streaks", {}).pop(chore_id, None) is not None:
             LOGGER.debug(
                 "Removed chore streak for chore '%s' from kid '%s'", chore_id, kid_id
             )
 
         # Remove any pending chore approvals for this kid and chore
+        self._remove_pending_chore_approvals(kid_id, chore_id)
+
+    def _remove_pending_chore_approvals(self, kid_id: str, chore_id: str) -> None:
+        """Remove the pending approvals of a chore for a kid, if there are any."""
+        pending_approvals = self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
+        if not any(
+            ap.get("kid_id") == kid_id and ap.get("chore_id") == chore_id
+            for ap in pending_approvals
+        ):
+            return
+
         self._data[DATA_PENDING_CHORE_APPROVALS] = [
             ap
-            for ap in self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
+            for ap in pending_approvals
             if not (ap.get("kid_id") == kid_id and ap.get("chore_id") == chore_id)
         ]
 
+    def _remove_pending_reward_approvals(self, kid_id: str, reward_id: str) -> None:
+        """Remove the pending approvals of a reward for a kid, if there are any."""
+        pending_approvals = self._data.get(DATA_PENDING_REWARD_APPROVALS, [])
+        if not any(
+            ap.get("kid_id") == kid_id and ap.get("reward_id") == reward_id
+            for ap in pending_approvals
+        ):
+            return
+
+        self._data[DATA_PENDING_REWARD_APPROVALS] = [
+            ap
+            for ap in pending_approvals
+            if not (ap.get("kid_id") == kid_id and ap.get("reward_id") == reward_id)
+        ]
+
     def _cleanup_pending_chore_approvals(self) -> None:
         """Remove any pending chore approvals for chore IDs that no longer exist."""
         valid_chore_ids = set(self._data.get(DATA_CHORES, {}).keys())
-        self._data[DATA_PENDING_CHORE_APPROVALS] = [
-            ap
-            for ap in self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
-            if ap.get("chore_id") in valid_chore_ids
-        ]
+        approvals = self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
+        filtered = [ap for ap in approvals if ap.get("chore_id") in valid_chore_ids]
+        if len(filtered) != len(approvals):
+            self._data[DATA_PENDING_CHORE_APPROVALS] = filtered
 
     def _cleanup_pending_reward_approvals(self) -> None:
         """Remove any pending reward approvals for reward IDs that no longer exist."""
         valid_reward_ids = set(self._data.get(DATA_REWARDS, {}).keys())
-        self._data[DATA_PENDING_REWARD_APPROVALS] = [
+        approvals = self._data.get(DATA_PENDING_REWARD_APPROVALS, [])
+        filtered = [
             approval
-            for approval in self._data.get(DATA_PENDING_REWARD_APPROVALS, [])
+            for approval in approvals
             if approval.get("reward_id") in valid_reward_ids
         ]
+        if len(filtered) != len(approvals):
+            self._data[DATA_PENDING_REWARD_APPROVALS] = filtered
 
-    def _cleanup_deleted_kid_references(self) -> None:
+    def _cleanup_deleted_kid_references(self, valid_kid_ids: set[str]) -> None:
         """Remove references to kids that no longer exist from other sections."""
-        valid_kid_ids = set(self.kids_data.keys())
 
         # Remove deleted kid IDs from all chore assignments
         for chore in self._data.get(DATA_CHORES, {}).values():
             if "assigned_kids" in chore:
                 original = chore["assigned_kids"]
-                filtered = [kid for kid in original if kid in valid_kid_ids]
-                if filtered != original:
-                    chore["assigned_kids"] = filtered
+                if not valid_kid_ids.issuperset(original):
+                    chore["assigned_kids"] = [
+                        kid for kid in original if kid in valid_kid_ids
+                    ]
                     LOGGER.debug(
                         "Cleaned up assigned_kids in chore '%s'", chore.get("name")
                     )
@@ -645,32 +749,31 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                     )
                 if "assigned_kids" in entity:
                     original_assigned = entity["assigned_kids"]
-                    filtered_assigned = [
-                        kid for kid in original_assigned if kid in valid_kid_ids
-                    ]
-                    if filtered_assigned != original_assigned:
-                        entity["assigned_kids"] = filtered_assigned
+                    if not valid_kid_ids.issuperset(original_assigned):
+                        entity["assigned_kids"] = [
+                            kid for kid in original_assigned if kid in valid_kid_ids
+                        ]
                         LOGGER.debug(
                             "Cleaned up assigned_kids in %s '%s'",
                             section,
                             entity.get("name"),
                         )
 
-    def _cleanup_deleted_chore_references(self) -> None:
+    def _cleanup_deleted_chore_references(self, valid_chore_ids: set[str]) -> None:
         """Remove references to chores that no longer exist from kid data."""
-        valid_chore_ids = set(self.chores_data.keys())
         for kid in self.kids_data.values():
             # Clean up list fields
             for key in ["claimed_chores", "approved_chores"]:
                 if key in kid:
                     original = kid[key]
-                    filtered = [chore for chore in original if chore in valid_chore_ids]
-                    if filtered != original:
-                        kid[key] = filtered
+                    if not valid_chore_ids.issuperset(original):
+                        kid[key] = [
+                            chore for chore in original if chore in valid_chore_ids
+                        ]
 
             # Clean up dictionary fields
             for dict_key in ["chore_claims", "chore_approvals"]:
-                if dict_key in kid:
+                if dict_key in kid and not valid_chore_ids.issuperset(kid[dict_key]):
                     kid[dict_key] = {
                         chore: count
                         for chore, count in kid[dict_key].items()
@@ -679,20 +782,24 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
             # Clean up chore streaks
             if "chore_streaks" in kid:
-                for chore in list(kid["chore_streaks"].keys()):
-                    if chore not in valid_chore_ids:
-                        del kid["chore_streaks"][chore]
-                        LOGGER.debug(
-                            "Removed chore streak for deleted chore '%s'", chore
-                        )
+                streaks = kid["chore_streaks"]
+                stale_chores = streaks.keys() - valid_chore_ids
+                if stale_chores:
+                    kid["chore_streaks"] = {
+                        chore: streak
+                        for chore, streak in streaks.items()
+                        if chore not in stale_chores
+                    }
+                    LOGGER.debug(
+                        "Removed chore streaks for deleted chores: %s", stale_chores
+                    )
 
-    def _cleanup_parent_assignments(self) -> None:
+    def _cleanup_parent_assignments(self, valid_kid_ids: set[str]) -> None:
         """Remove any kid IDs from parent's 'associated_kids' that no longer exist."""
-        valid_kid_ids = set(self.kids_data.keys())
         for parent in self._data.get(DATA_PARENTS, {}).values():
             original = parent.get("associated_kids", [])
-            filtered = [kid_id for kid_id in original if kid_id in valid_kid_ids]
-            if filtered != original:
+            if not valid_kid_ids.issuperset(original):
+                filtered = [kid_id for kid_id in original if kid_id in valid_kid_ids]
                 parent["associated_kids"] = filtered
                 LOGGER.debug(
                     "Cleaned up associated_kids for parent '%s'. New list: %s",
@@ -700,9 +807,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                     filtered,
                 )
 
-    def _cleanup_deleted_chore_in_achievements(self) -> None:
+    def _cleanup_deleted_chore_in_achievements(self, valid_chore_ids: set[str]) -> None:
         """Clear selected_chore_id in achievements if the chore no longer exists."""
-        valid_chore_ids = set(self.chores_data.keys())
         for achievement in self._data.get(DATA_ACHIEVEMENTS, {}).values():
             selected = achievement.get("selected_chore_id")
             if selected and selected not in valid_chore_ids:
@@ -712,9 +818,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                     achievement.get("name"),
                 )
 
-    def _cleanup_deleted_chore_in_challenges(self) -> None:
+    def _cleanup_deleted_chore_in_challenges(self, valid_chore_ids: set[str]) -> None:
         """Clear selected_chore_id in challenges if the chore no longer exists."""
-        valid_chore_ids = set(self.chores_data.keys())
         for challenge in self._data.get(DATA_CHALLENGES, {}).values():
             selected = challenge.get("selected_chore_id")
             if selected and selected not in valid_chore_ids:
@@ -765,6 +870,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             "last_chore_date": None,
             "overdue_chores": [],
             "overdue_notifications": {},
+            "today_chore_approvals": {},
         }
 
         self._normalize_kid_lists(self._data[DATA_KIDS][kid_id])
@@ -814,6 +920,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         kid_info.setdefault("last_chore_date", None)
         kid_info.setdefault("overdue_chores", [])
         kid_info.setdefault("overdue_notifications", {})
+        kid_info.setdefault("today_chore_approvals", {})
 
         self._normalize_kid_lists(self._data[DATA_KIDS][kid_id])
 
@@ -882,10 +989,16 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         LOGGER.debug("Updated parent '%s' with ID: %s", parent_info["name"], parent_id)
 
     # -- Chores
-    def _create_chore(self, chore_id: str, chore_data: dict[str, Any]):
+    def _get_assigned_kid_ids(
+        self, chore_id: str, chore_data: dict[str, Any]
+    ) -> list[str]:
+        """Resolve the kid names assigned to a chore into kid IDs."""
+        kid_ids_by_name = {
+            kid_info.get("name"): kid_id for kid_id, kid_info in self.kids_data.items()
+        }
         assigned_kids_ids = []
         for kid_name in chore_data.get("assigned_kids", []):
-            kid_id = self._get_kid_id_by_name(kid_name)
+            kid_id = kid_ids_by_name.get(kid_name)
             if kid_id:
                 assigned_kids_ids.append(kid_id)
             else:
@@ -894,13 +1007,15 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                     chore_data.get("name", chore_id),
                     kid_name,
                 )
+        return assigned_kids_ids
+
+    def _create_chore(self, chore_id: str, chore_data: dict[str, Any]):
+        assigned_kids_ids = self._get_assigned_kid_ids(chore_id, chore_data)
 
         # If chore is recurring, set due_date to creation date if not set
         freq = chore_data.get("recurring_frequency", FREQUENCY_NONE)
         if freq != FREQUENCY_NONE and not chore_data.get("due_date"):
-            now_local = dt_util.utcnow().astimezone(
-                dt_util.get_time_zone(self.hass.config.time_zone)
-            )
+            now_local = dt_util.as_local(dt_util.utcnow())
             # Force the time to 23:59:00 (and zero microseconds)
             default_due = now_local.replace(hour=23, minute=59, second=0, microsecond=0)
             chore_data["due_date"] = default_due.isoformat()
@@ -926,15 +1041,15 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             "icon": chore_data.get("icon", DEFAULT_ICON),
             "shared_chore": chore_data.get("shared_chore", False),
             "assigned_kids": assigned_kids_ids,
-            "recurring_frequency": chore_data.get(
-                "recurring_frequency", FREQUENCY_NONE
+            "recurring_frequency": freq,
+            "custom_interval": (
+                chore_data.get("custom_interval") if freq == FREQUENCY_CUSTOM else None
+            ),
+            "custom_interval_unit": (
+                chore_data.get("custom_interval_unit")
+                if freq == FREQUENCY_CUSTOM
+                else None
             ),
-            "custom_interval": chore_data.get("custom_interval")
-            if chore_data.get("recurring_frequency") == FREQUENCY_CUSTOM
-            else None,
-            "custom_interval_unit": chore_data.get("custom_interval_unit")
-            if chore_data.get("recurring_frequency") == FREQUENCY_CUSTOM
-            else None,
             "due_date": chore_data.get("due_date"),
             "last_completed": chore_data.get("last_completed"),
             "last_claimed": chore_data.get("last_claimed"),
@@ -957,17 +1072,16 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         )
 
         # Notify Kids of new chore
-        new_name = self._data[DATA_CHORES][chore_id]["name"]
-        due_date = self._data[DATA_CHORES][chore_id]["due_date"]
-        for kid_id in assigned_kids_ids:
+        if assigned_kids_ids:
+            new_name = self._data[DATA_CHORES][chore_id]["name"]
+            due_date = self._data[DATA_CHORES][chore_id]["due_date"]
             due_str = due_date if due_date else "No due date set"
-            extra_data = {"kid_id": kid_id, "chore_id": chore_id}
-            self.hass.async_create_task(
-                self._notify_kid(
-                    kid_id,
+            self._schedule_notification(
+                self._notify_kids(
+                    assigned_kids_ids,
+                    chore_id,
                     title="KidsChores: New Chore",
                     message=f"A new chore '{new_name}' was assigned to you! Due: {due_str}",
-                    extra_data=extra_data,
                 )
             )
 
@@ -995,26 +1109,18 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             "shared_chore", chore_info["shared_chore"]
         )
 
-        assigned_kids_ids = []
-        for kid_name in chore_data.get("assigned_kids", []):
-            kid_id = self._get_kid_id_by_name(kid_name)
-            if kid_id:
-                assigned_kids_ids.append(kid_id)
-            else:
-                LOGGER.warning(
-                    "Chore '%s': Kid name '%s' not found. Skipping assignment",
-                    chore_data.get("name", chore_id),
-                    kid_name,
-                )
-        old_assigned = set(chore_info.get("assigned_kids", []))
-        new_assigned = set(assigned_kids_ids)
-        removed_kids = old_assigned - new_assigned
-        for kid in removed_kids:
-            self._remove_kid_chore_entities(kid, chore_id)
-            self._cleanup_chore_from_kid(kid, chore_id)
+        assigned_kids_ids = self._get_assigned_kid_ids(chore_id, chore_data)
+        # Keep the configured order, dropping duplicates
+        assigned_kids_ids = list(dict.fromkeys(assigned_kids_ids))
+        old_assigned = chore_info.get("assigned_kids", [])
+        if assigned_kids_ids != old_assigned:
+            removed_kids = set(old_assigned).difference(assigned_kids_ids)
+            for kid in removed_kids:
+                self._remove_kid_chore_entities(kid, chore_id)
+                self._cleanup_chore_from_kid(kid, chore_id)
 
-        # Update the chore's assigned kids list with the new assignments
-        chore_info["assigned_kids"] = list(new_assigned)
+            # Update the chore's assigned kids list with the new assignments
+            chore_info["assigned_kids"] = assigned_kids_ids
 
         chore_info["recurring_frequency"] = chore_data.get(
             "recurring_frequency", chore_info["recurring_frequency"]
@@ -1275,12 +1381,8 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             "criteria": challenge_data.get("criteria", ""),
             "target_value": challenge_data.get("target_value", 1),
             "reward_points": challenge_data.get("reward_points", 0),
-            "start_date": challenge_data.get("start_date")
-            if challenge_data.get("start_date") not in [None, {}]
-            else None,
-            "end_date": challenge_data.get("end_date")
-            if challenge_data.get("end_date") not in [None, {}]
-            else None,
+            "start_date": challenge_data.get("start_date") or None,
+            "end_date": challenge_data.get("end_date") or None,
             "progress": challenge_data.get("progress", {}),
             "internal_id": challenge_id,
         }
@@ -1316,69 +1418,12 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         challenge_info["reward_points"] = challenge_data.get(
             "reward_points", challenge_info["reward_points"]
         )
-        challenge_info["start_date"] = (
-            challenge_data.get("start_date")
-            if challenge_data.get("start_date") not in [None, {}]
-            else None
-        )
-        challenge_info["end_date"] = (
-            challenge_data.get("end_date")
-            if challenge_data.get("end_date") not in [None, {}]
-            else None
-        )
+        challenge_info["start_date"] = challenge_data.get("start_date") or None
+        challenge_info["end_date"] = challenge_data.get("end_date") or None
         LOGGER.debug(
             "Updated challenge '%s' with ID: %s", challenge_info["name"], challenge_id
         )
 
-    # -------------------------------------------------------------------------------------
-    # Properties for Easy Access
-    # -------------------------------------------------------------------------------------
-
-    @property
-    def kids_data(self) -> dict[str, Any]:
-        """Return the kids data."""
-        return self._data.get(DATA_KIDS, {})
-
-    @property
-    def parents_data(self) -> dict[str, Any]:
-        """Return the parents data."""
-        return self._data.get(DATA_PARENTS, {})
-
-    @property
-    def chores_data(self) -> dict[str, Any]:
-        """Return the chores data."""
-        return self._data.get(DATA_CHORES, {})
-
-    @property
-    def badges_data(self) -> dict[str, Any]:
-        """Return the badges data."""
-        return self._data.get(DATA_BADGES, {})
-
-    @property
-    def rewards_data(self) -> dict[str, Any]:
-        """Return the rewards data."""
-        return self._data.get(DATA_REWARDS, {})
-
-    @property
-    def penalties_data(self) -> dict[str, Any]:
-        """Return the penalties data."""
-        return self._data.get(DATA_PENALTIES, {})
-
-    @property
-    def achievements_data(self) -> dict[str, Any]:
-        """Return the achievements data."""
-        return self._data.get(DATA_ACHIEVEMENTS, {})  # New
-
-    @property
-    def challenges_data(self) -> dict[str, Any]:
-        """Return the challenges data."""
-        return self._data.get(DATA_CHALLENGES, {})
-
-    @property
-    def bonuses_data(self) -> dict[str, Any]:
-        """Return the bonuses data."""
-        return self._data.get(DATA_BONUSES, {})
-
     # -------------------------------------------------------------------------------------
     # Parents: Add, Remove
     # -------------------------------------------------------------------------------------
@@ -1438,11 +1483,16 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
     def claim_chore(self, kid_id: str, chore_id: str, user_name: str):
         """Kid claims chore => state=claimed; parent must then approve."""
-        if chore_id not in self.chores_data:
+        chore_info = self.chores_data.get(chore_id)
+        if chore_info is None:
             LOGGER.warning("Chore ID '%s' not found for claim", chore_id)
             raise HomeAssistantError(f"Chore with ID '{chore_id}' not found.")
 
-        chore_info = self.chores_data[chore_id]
+        kid_info = self.kids_data.get(kid_id)
+        if kid_info is None:
+            LOGGER.warning("Kid ID '%s' not found", kid_id)
+            raise HomeAssistantError(f"Kid with ID '{kid_id}' not found.")
+
         if kid_id not in chore_info.get("assigned_kids", []):
             LOGGER.warning(
                 "Claim chore: Chore ID '%s' not assigned to kid ID '%s'",
@@ -1450,23 +1500,13 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 kid_id,
             )
             raise HomeAssistantError(
-                f"Chore '{chore_info.get('name')}' is not assigned to kid '{self.kids_data[kid_id]['name']}'."
+                f"Chore '{chore_info.get('name')}' is not assigned to kid '{kid_info['name']}'."
             )
 
-        if kid_id not in self.kids_data:
-            LOGGER.warning("Kid ID '%s' not found", kid_id)
-            raise HomeAssistantError(f"Kid with ID '{kid_id}' not found.")
-
-        kid_info = self.kids_data.get(kid_id)
-
-        self._normalize_kid_lists(kid_info)
-
         allow_multiple = chore_info.get("allow_multiple_claims_per_day", False)
         if allow_multiple:
             # If already approved, remove it so the new claim can trigger a new approval flow
-            kid_info["approved_chores"] = [
-                item for item in kid_info.get("approved_chores", []) if item != chore_id
-            ]
+            self._remove_chore_from_kid_list(kid_info, "approved_chores", chore_id)
 
         if not allow_multiple:
             if chore_id in kid_info.get(
@@ -1480,30 +1520,17 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
         # Send a notification to the parents that a kid claimed a chore
         if chore_info.get(CONF_NOTIFY_ON_CLAIM, DEFAULT_NOTIFY_ON_CLAIM):
-            actions = [
-                {
-                    "action": f"{ACTION_APPROVE_CHORE}|{kid_id}|{chore_id}",
-                    "title": ACTION_TITLE_APPROVE,
-                },
-                {
-                    "action": f"{ACTION_DISAPPROVE_CHORE}|{kid_id}|{chore_id}",
-                    "title": ACTION_TITLE_DISAPPROVE,
-                },
-                {
-                    "action": f"{ACTION_REMIND_30}|{kid_id}|{chore_id}",
-                    "title": ACTION_TITLE_REMIND_30,
-                },
-            ]
+            actions = build_approval_actions(CHORE_APPROVAL_ACTIONS, kid_id, chore_id)
             # Pass extra context so the event handler can route the action.
             extra_data = {
                 "kid_id": kid_id,
                 "chore_id": chore_id,
             }
-            self.hass.async_create_task(
+            self._schedule_notification(
                 self._notify_parents(
                     kid_id,
                     title="KidsChores: Chore Claimed",
-                    message=f"'{self.kids_data[kid_id]['name']}' claimed chore '{self.chores_data[chore_id]['name']}'",
+                    message=f"'{kid_info['name']}' claimed chore '{chore_info['name']}'",
                     actions=actions,
                     extra_data=extra_data,
                 )
@@ -1520,20 +1547,19 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         points_awarded: Optional[float] = None,
     ):
         """Approve a chore for kid_id if assigned."""
-        if chore_id not in self.chores_data:
+        chore_info = self.chores_data.get(chore_id)
+        if chore_info is None:
             raise HomeAssistantError(f"Chore with ID '{chore_id}' not found.")
 
-        chore_info = self.chores_data[chore_id]
+        kid_info = self.kids_data.get(kid_id)
+        if kid_info is None:
+            raise HomeAssistantError(f"Kid with ID '{kid_id}' not found.")
+
         if kid_id not in chore_info.get("assigned_kids", []):
             raise HomeAssistantError(
-                f"Chore '{chore_info.get('name')}' is not assigned to kid '{self.kids_data[kid_id]['name']}'."
+                f"Chore '{chore_info.get('name')}' is not assigned to kid '{kid_info['name']}'."
             )
 
-        if kid_id not in self.kids_data:
-            raise HomeAssistantError(f"Kid with ID '{kid_id}' not found.")
-
-        kid_info = self.kids_data.get(kid_id)
-
         allow_multiple = chore_info.get("allow_multiple_claims_per_day", False)
         if not allow_multiple:
             if chore_id in kid_info.get("approved_chores", []):
@@ -1541,8 +1567,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 LOGGER.warning(error_message)
                 raise HomeAssistantError(error_message)
 
+        now = dt_util.utcnow()
+        today = dt_util.as_local(now).date()
+
         default_points = chore_info.get("default_points", DEFAULT_POINTS)
-        multiplier = kid_info.get("points_multiplier", 1.0)
+        multiplier = kid_info["points_multiplier"]
         awarded_points = (
             points_awarded * multiplier
             if points_awarded is not None
@@ -1566,95 +1595,54 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
         # Track today’s approvals for chores that allow multiple claims.
         if chore_info.get("allow_multiple_claims_per_day", False):
-            kid_info.setdefault("today_chore_approvals", {})
-            kid_info["today_chore_approvals"][chore_id] = (
-                kid_info["today_chore_approvals"].get(chore_id, 0) + 1
-            )
+            today_approvals = kid_info["today_chore_approvals"]
+            today_approvals[chore_id] = today_approvals.get(chore_id, 0) + 1
 
-        chore_info["last_completed"] = dt_util.utcnow().isoformat()
+        chore_info["last_completed"] = now.isoformat()
 
-        today = dt_util.as_local(dt_util.utcnow()).date()
         self._update_chore_streak_for_kid(kid_id, chore_id, today)
         self._update_overall_chore_streak(kid_id, today)
 
-        # remove from pending approvals
-        self._data[DATA_PENDING_CHORE_APPROVALS] = [
-            ap
-            for ap in self._data[DATA_PENDING_CHORE_APPROVALS]
-            if not (ap["kid_id"] == kid_id and ap["chore_id"] == chore_id)
-        ]
-
         # increment chore approvals
-        if chore_id in kid_info["chore_approvals"]:
-            kid_info["chore_approvals"][chore_id] += 1
-        else:
-            kid_info["chore_approvals"][chore_id] = 1
+        chore_approvals = kid_info["chore_approvals"]
+        chore_approvals[chore_id] = chore_approvals.get(chore_id, 0) + 1
 
         # Manage Achievements
-        today = dt_util.as_local(dt_util.utcnow()).date()
-        for achievement_id, achievement in self.achievements_data.items():
-            if achievement.get("type") == ACHIEVEMENT_TYPE_STREAK:
-                selected_chore_id = achievement.get("selected_chore_id")
-                if selected_chore_id == chore_id:
-                    # Get or create the progress dict for this kid
-                    progress = achievement.setdefault("progress", {}).setdefault(
-                        kid_id,
-                        {"current_streak": 0, "last_date": None, "awarded": False},
-                    )
-                    self._update_streak_progress(progress, today)
+        for achievement_id in self._streak_achievements_by_chore.get(chore_id, []):
+            achievement = self.achievements_data[achievement_id]
+            # Get or create the progress dict for this kid
+            progress = achievement.setdefault("progress", {}).setdefault(
+                kid_id,
+                {"current_streak": 0, "last_date": None, "awarded": False},
+            )
+            self._update_streak_progress(progress, today)
 
         # Manage Challenges
-        today_iso = dt_util.as_local(dt_util.utcnow()).date().isoformat()
-        for challenge_id, challenge in self.challenges_data.items():
-            if challenge.get("type") == CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW:
-                # (Challenge update logic for total-within-window remains here)
-                start_date_raw = challenge.get("start_date")
-                if isinstance(start_date_raw, str):
-                    start_date = dt_util.parse_datetime(start_date_raw)
-                    if start_date and start_date.tzinfo is None:
-                        start_date = start_date.replace(tzinfo=dt_util.UTC)
-                else:
-                    start_date = None
-
-                end_date_raw = challenge.get("end_date")
-                if isinstance(end_date_raw, str):
-                    end_date = dt_util.parse_datetime(end_date_raw)
-                    if end_date and end_date.tzinfo is None:
-                        end_date = end_date.replace(tzinfo=dt_util.UTC)
-                else:
-                    end_date = None
-
-                now = dt_util.utcnow()
+        for challenge_id in self._window_challenge_ids:
+            challenge = self.challenges_data[challenge_id]
+            start_date, end_date = self._get_challenge_window(challenge_id, challenge)
 
-                if start_date and end_date and start_date <= now <= end_date:
-                    progress = challenge.setdefault("progress", {}).setdefault(
-                        kid_id, {"count": 0, "awarded": False}
-                    )
-                    progress["count"] += 1
+            if start_date and end_date and start_date <= now <= end_date:
+                progress = challenge.setdefault("progress", {}).setdefault(
+                    kid_id, {"count": 0, "awarded": False}
+                )
+                progress["count"] += 1
 
-            elif challenge.get("type") == CHALLENGE_TYPE_DAILY_MIN:
-                # Only update if the challenge is tracking a specific chore.
-                selected_chore = challenge.get("selected_chore_id")
-                if not selected_chore:
-                    LOGGER.warning(
-                        "Challenge '%s' of type daily_min has no selected_chore_id set. Skipping progress update.",
-                        challenge.get("name"),
-                    )
-                    continue
-                if selected_chore != chore_id:
-                    continue
-                if kid_id in challenge.get("assigned_kids", []):
-                    progress = challenge.setdefault("progress", {}).setdefault(
-                        kid_id, {"daily_counts": {}, "awarded": False}
-                    )
-                    progress["daily_counts"][today_iso] = (
-                        progress["daily_counts"].get(today_iso, 0) + 1
-                    )
+        today_iso = today.isoformat()
+        for challenge_id in self._daily_min_challenges_by_kid_chore.get(
+            (kid_id, chore_id), []
+        ):
+            challenge = self.challenges_data[challenge_id]
+            progress = challenge.setdefault("progress", {}).setdefault(
+                kid_id, {"daily_counts": {}, "awarded": False}
+            )
+            daily_counts = progress["daily_counts"]
+            daily_counts[today_iso] = daily_counts.get(today_iso, 0) + 1
 
         # Send a notification to the kid that chore was approved
         if chore_info.get(CONF_NOTIFY_ON_APPROVAL, DEFAULT_NOTIFY_ON_APPROVAL):
             extra_data = {"kid_id": kid_id, "chore_id": chore_id}
-            self.hass.async_create_task(
+            self._schedule_notification(
                 self._notify_kid(
                     kid_id,
                     title="KidsChores: Chore Approved",
@@ -1681,7 +1669,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         # Send a notification to the kid that chore was disapproved
         if chore_info.get(CONF_NOTIFY_ON_DISAPPROVAL, DEFAULT_NOTIFY_ON_DISAPPROVAL):
             extra_data = {"kid_id": kid_id, "chore_id": chore_id}
-            self.hass.async_create_task(
+            self._schedule_notification(
                 self._notify_kid(
                     kid_id,
                     title="KidsChores: Chore Disapproved",
@@ -1707,6 +1695,38 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         self.async_set_updated_data(self._data)
         LOGGER.debug(f"Chore ID '{chore_id}' state manually updated to '{state}'")
 
+    def get_kid_chores_by_state(self, kid_id: str) -> dict[str, list[str]]:
+        """Group the chores assigned to a kid by that kid's own chore state.
+
+        The grouping is computed once per coordinator update and shared by all
+        callers until the next one, so the returned lists must not be modified.
+        """
+        cached = self._kid_chores_by_state.get(kid_id)
+        if cached is not None:
+            return cached
+
+        kid_info = self.kids_data.get(kid_id, {})
+        approved = set(kid_info.get("approved_chores", []))
+        claimed = set(kid_info.get("claimed_chores", []))
+        overdue = set(kid_info.get("overdue_chores", []))
+
+        chores_by_state = {state: [] for state in CHORE_STATES_TRACKED}
+        for chore_id, chore_info in self.chores_data.items():
+            if kid_id not in chore_info.get("assigned_kids", []):
+                continue
+            # Same precedence as the per-chore status sensor
+            if chore_id in approved:
+                chores_by_state[CHORE_STATE_APPROVED].append(chore_id)
+            elif chore_id in claimed:
+                chores_by_state[CHORE_STATE_CLAIMED].append(chore_id)
+            elif chore_id in overdue:
+                chores_by_state[CHORE_STATE_OVERDUE].append(chore_id)
+            else:
+                chores_by_state[CHORE_STATE_PENDING].append(chore_id)
+
+        self._kid_chores_by_state[kid_id] = chores_by_state
+        return chores_by_state
+
     # -------------------------------------------------------------------------------------
     # Chore State Processing: Centralized Function
     # The most critical thing to understand when working on this function is that
@@ -1746,89 +1766,63 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             )
             return
 
-        # Clear any overdue tracking.
-        kid_info.setdefault("overdue_chores", [])
-        kid_info.setdefault("overdue_notifications", {})
-
-        # Remove all instances of the chore from overdue lists.
-        kid_info["overdue_chores"] = [
-            entry for entry in kid_info.get("overdue_chores", []) if entry != chore_id
-        ]
+        now = dt_util.utcnow()
 
-        if chore_id in kid_info["overdue_notifications"]:
-            kid_info["overdue_notifications"].pop(chore_id)
+        # Clear any overdue tracking for this chore.
+        self._remove_chore_from_kid_list(kid_info, "overdue_chores", chore_id)
+        kid_info["overdue_notifications"].pop(chore_id, None)
 
         if new_state == CHORE_STATE_CLAIMED:
             # Remove all previous approvals in case of duplicate, add to claimed.
-            kid_info["approved_chores"] = [
-                item for item in kid_info.get("approved_chores", []) if item != chore_id
-            ]
-
-            kid_info.setdefault("claimed_chores", [])
+            self._remove_chore_from_kid_list(kid_info, "approved_chores", chore_id)
 
             if chore_id not in kid_info["claimed_chores"]:
                 kid_info["claimed_chores"].append(chore_id)
 
-            chore_info["last_claimed"] = dt_util.utcnow().isoformat()
+            now_iso = now.isoformat()
+            chore_info["last_claimed"] = now_iso
 
             self._data.setdefault(DATA_PENDING_CHORE_APPROVALS, []).append(
                 {
                     "kid_id": kid_id,
                     "chore_id": chore_id,
-                    "timestamp": dt_util.utcnow().isoformat(),
+                    "timestamp": now_iso,
                 }
             )
 
         elif new_state == CHORE_STATE_APPROVED:
             # Remove all claims for chores in case of duplicates, add to approvals.
-            kid_info["claimed_chores"] = [
-                item for item in kid_info.get("claimed_chores", []) if item != chore_id
-            ]
-
-            kid_info.setdefault("approved_chores", [])
+            self._remove_chore_from_kid_list(kid_info, "claimed_chores", chore_id)
 
             if chore_id not in kid_info["approved_chores"]:
                 kid_info["approved_chores"].append(chore_id)
 
-            chore_info["last_completed"] = dt_util.utcnow().isoformat()
+            chore_info["last_completed"] = now.isoformat()
 
             if points_awarded is not None:
-                current_points = float(kid_info.get("points", 0))
+                current_points = float(kid_info["points"])
                 self.update_kid_points(kid_id, current_points + points_awarded)
 
-            today = dt_util.as_local(dt_util.utcnow()).date()
+            today = dt_util.as_local(now).date()
 
             self._update_chore_streak_for_kid(kid_id, chore_id, today)
             self._update_overall_chore_streak(kid_id, today)
 
-            self._data[DATA_PENDING_CHORE_APPROVALS] = [
-                ap
-                for ap in self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
-                if not (ap.get("kid_id") == kid_id and ap.get("chore_id") == chore_id)
-            ]
+            self._remove_pending_chore_approvals(kid_id, chore_id)
 
         elif new_state == CHORE_STATE_PENDING:
             # Remove the chore from both claimed and approved lists.
             for field in ["claimed_chores", "approved_chores"]:
-                if chore_id in kid_info.get(field, []):
-                    kid_info[field] = [c for c in kid_info[field] if c != chore_id]
+                self._remove_chore_from_kid_list(kid_info, field, chore_id)
 
             # Remove from pending approvals.
-            self._data[DATA_PENDING_CHORE_APPROVALS] = [
-                ap
-                for ap in self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
-                if not (ap.get("kid_id") == kid_id and ap.get("chore_id") == chore_id)
-            ]
+            self._remove_pending_chore_approvals(kid_id, chore_id)
 
         elif new_state == CHORE_STATE_OVERDUE:
             # Mark as overdue.
-            kid_info.setdefault("overdue_chores", [])
-
             if chore_id not in kid_info["overdue_chores"]:
                 kid_info["overdue_chores"].append(chore_id)
-
-            kid_info.setdefault("overdue_notifications", {})
-            kid_info["overdue_notifications"][chore_id] = dt_util.utcnow().isoformat()
+            kid_info["overdue_notifications"][chore_id] = now.isoformat()
 
         # Compute and update the chore's global state.
         # Given the process above is handling everything properly for each kid, computing the global state straightforward.
@@ -1840,41 +1834,43 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             chore_info["state"] = new_state
         elif len(assigned_kids) > 1:
             # For chores assigned to multiple kids, you have to figure out the global state
-            count_pending = count_claimed = count_approved = count_overdue = 0
-            for kid_id in assigned_kids:
-                kid_info = self.kids_data.get(kid_id, {})
-                if chore_id in kid_info.get("overdue_chores", []):
-                    count_overdue += 1
-                elif chore_id in kid_info.get("approved_chores", []):
-                    count_approved += 1
-                elif chore_id in kid_info.get("claimed_chores", []):
-                    count_claimed += 1
+            shared_chore = chore_info.get("shared_chore", False)
+            kid_states = set()
+            for assigned_kid_id in assigned_kids:
+                assigned_kid_info = self.kids_data.get(assigned_kid_id, {})
+                if chore_id in assigned_kid_info.get("overdue_chores", []):
+                    kid_states.add(CHORE_STATE_OVERDUE)
+                elif chore_id in assigned_kid_info.get("approved_chores", []):
+                    kid_states.add(CHORE_STATE_APPROVED)
+                elif chore_id in assigned_kid_info.get("claimed_chores", []):
+                    kid_states.add(CHORE_STATE_CLAIMED)
                 else:
-                    count_pending += 1
-            total = len(assigned_kids)
+                    kid_states.add(CHORE_STATE_PENDING)
+
+                # Stop once the outcome can no longer change: mixed states make a
+                # non-shared chore independent, and overdue wins for shared chores
+                if len(kid_states) > 1 and (
+                    not shared_chore or CHORE_STATE_OVERDUE in kid_states
+                ):
+                    break
 
             # If all kids are in the same state, update the chore state to new state 1:1
-            if (
-                count_pending == total
-                or count_claimed == total
-                or count_approved == total
-                or count_overdue == total
-            ):
+            if len(kid_states) == 1:
                 chore_info["state"] = new_state
 
             # For shared chores, recompute global state of a partial if they aren't all in the same state as checked above
-            elif chore_info.get("shared_chore", False):
-                if count_overdue > 0:
+            elif shared_chore:
+                if CHORE_STATE_OVERDUE in kid_states:
                     chore_info["state"] = CHORE_STATE_OVERDUE
-                elif count_approved > 0:
+                elif CHORE_STATE_APPROVED in kid_states:
                     chore_info["state"] = CHORE_STATE_APPROVED_IN_PART
-                elif count_claimed > 0:
+                elif CHORE_STATE_CLAIMED in kid_states:
                     chore_info["state"] = CHORE_STATE_CLAIMED_IN_PART
                 else:
                     chore_info["state"] = CHORE_STATE_UNKNOWN
 
             # For non-shared chores multiple assign it will be independent if they aren't all in the same state as checked above.
-            elif chore_info.get("shared_chore", False) is False:
+            else:
                 chore_info["state"] = CHORE_STATE_INDEPENDENT
 
         else:
@@ -1909,7 +1905,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         kid_info["points_earned_monthly"] += delta
 
         # Update Max Points Ever
-        if new_points > kid_info.get("max_points_ever", 0):
+        if new_points > kid_info["max_points_ever"]:
             kid_info["max_points_ever"] = new_points
 
         # Check Badges
@@ -1948,8 +1944,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 f"'{kid_info['name']}' does not have enough points ({cost} needed)."
             )
 
-        kid_info.setdefault("pending_rewards", []).append(reward_id)
-        kid_info.setdefault("redeemed_rewards", [])
+        kid_info["pending_rewards"].append(reward_id)
 
         # Add to pending approvals
         self._data[DATA_PENDING_REWARD_APPROVALS].append(
@@ -1961,28 +1956,13 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         )
 
         # increment reward_claims counter
-        if reward_id in kid_info["reward_claims"]:
-            kid_info["reward_claims"][reward_id] += 1
-        else:
-            kid_info["reward_claims"][reward_id] = 1
+        reward_claims = kid_info["reward_claims"]
+        reward_claims[reward_id] = reward_claims.get(reward_id, 0) + 1
 
         # Send a notification to the parents that a kid claimed a reward
-        actions = [
-            {
-                "action": f"{ACTION_APPROVE_REWARD}|{kid_id}|{reward_id}",
-                "title": ACTION_TITLE_APPROVE,
-            },
-            {
-                "action": f"{ACTION_DISAPPROVE_REWARD}|{kid_id}|{reward_id}",
-                "title": ACTION_TITLE_DISAPPROVE,
-            },
-            {
-                "action": f"{ACTION_REMIND_30}|{kid_id}|{reward_id}",
-                "title": ACTION_TITLE_REMIND_30,
-            },
-        ]
+        actions = build_approval_actions(REWARD_APPROVAL_ACTIONS, kid_id, reward_id)
         extra_data = {"kid_id": kid_id, "reward_id": reward_id}
-        self.hass.async_create_task(
+        self._schedule_notification(
             self._notify_parents(
                 kid_id,
                 title="KidsChores: Reward Claimed",
@@ -2037,14 +2017,12 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 break  # Stop after the first removal
 
         # increment reward_approvals
-        if reward_id in kid_info["reward_approvals"]:
-            kid_info["reward_approvals"][reward_id] += 1
-        else:
-            kid_info["reward_approvals"][reward_id] = 1
+        reward_approvals = kid_info["reward_approvals"]
+        reward_approvals[reward_id] = reward_approvals.get(reward_id, 0) + 1
 
         # Send a notification to the kid that reward was approved
         extra_data = {"kid_id": kid_id, "reward_id": reward_id}
-        self.hass.async_create_task(
+        self._schedule_notification(
             self._notify_kid(
                 kid_id,
                 title="KidsChores: Reward Approved",
@@ -2064,11 +2042,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             raise HomeAssistantError(f"Reward with ID '{reward_id}' not found.")
 
         # remove from pending approvals
-        self._data[DATA_PENDING_REWARD_APPROVALS] = [
-            ap
-            for ap in self._data[DATA_PENDING_REWARD_APPROVALS]
-            if not (ap["kid_id"] == kid_id and ap["reward_id"] == reward_id)
-        ]
+        self._remove_pending_reward_approvals(kid_id, reward_id)
 
         kid_info = self.kids_data.get(kid_id)
         if kid_info and reward_id in kid_info.get("pending_rewards", []):
@@ -2076,7 +2050,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
         # Send a notification to the kid that reward was disapproved
         extra_data = {"kid_id": kid_id, "reward_id": reward_id}
-        self.hass.async_create_task(
+        self._schedule_notification(
             self._notify_kid(
                 kid_id,
                 title="KidsChores: Reward Disapproved",
@@ -2171,7 +2145,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
 
             # Send a notification to the kid and parents that a new badge was earned
             extra_data = {"kid_id": kid_id, "badge_id": badge_id}
-            self.hass.async_create_task(
+            self._schedule_notification(
                 self._notify_kid(
                     kid_id,
                     title="KidsChores: Badge Earned",
@@ -2179,7 +2153,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                     extra_data=extra_data,
                 )
             )
-            self.hass.async_create_task(
+            self._schedule_notification(
                 self._notify_parents(
                     kid_id,
                     title="KidsChores: Badge Earned",
@@ -2255,14 +2229,12 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         self.update_kid_points(kid_id, new_points)
 
         # increment penalty_applies
-        if penalty_id in kid_info["penalty_applies"]:
-            kid_info["penalty_applies"][penalty_id] += 1
-        else:
-            kid_info["penalty_applies"][penalty_id] = 1
+        penalty_applies = kid_info["penalty_applies"]
+        penalty_applies[penalty_id] = penalty_applies.get(penalty_id, 0) + 1
 
         # Send a notification to the kid that a penalty was applied
         extra_data = {"kid_id": kid_id, "penalty_id": penalty_id}
-        self.hass.async_create_task(
+        self._schedule_notification(
             self._notify_kid(
                 kid_id,
                 title="KidsChores: Penalty Applied",
@@ -2314,14 +2286,12 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         self.update_kid_points(kid_id, new_points)
 
         # increment bonus_applies
-        if bonus_id in kid_info["bonus_applies"]:
-            kid_info["bonus_applies"][bonus_id] += 1
-        else:
-            kid_info["bonus_applies"][bonus_id] = 1
+        bonus_applies = kid_info["bonus_applies"]
+        bonus_applies[bonus_id] = bonus_applies.get(bonus_id, 0) + 1
 
         # Send a notification to the kid that a bonus was applied
         extra_data = {"kid_id": kid_id, "bonus_id": bonus_id}
-        self.hass.async_create_task(
+        self._schedule_notification(
             self._notify_kid(
                 kid_id,
                 title="KidsChores: Bonus Applied",
@@ -2462,32 +2432,59 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             self.update_kid_points(kid_id, new_points)
 
         # Notify kid and parents
+        achievement_name = achievement.get("name")
         extra_data = {"kid_id": kid_id, "achievement_id": achievement_id}
-        self.hass.async_create_task(
+        self._schedule_notification(
             self._notify_kid(
                 kid_id,
                 title="KidsChores: Achievement Earned",
-                message=f"You have earned the achievement: '{achievement.get('name')}'.",
+                message=f"You have earned the achievement: '{achievement_name}'.",
                 extra_data=extra_data,
             )
         )
-        self.hass.async_create_task(
+        self._schedule_notification(
             self._notify_parents(
                 kid_id,
                 title="KidsChores: Achievement Earned",
-                message=f"{self.kids_data[kid_id]['name']} has earned the achievement: '{achievement.get('name')}'.",
+                message=f"{kid_info['name']} has earned the achievement: '{achievement_name}'.",
                 extra_data=extra_data,
             )
         )
-        LOGGER.info(
-            "Awarded achievement '%s' to kid '%s'", achievement.get("name"), kid_id
-        )
+        LOGGER.info("Awarded achievement '%s' to kid '%s'", achievement_name, kid_id)
         self._persist()
         self.async_set_updated_data(self._data)
 
     # -------------------------------------------------------------------------
     # Challenges: Check, Award
     # -------------------------------------------------------------------------
+    def _parse_challenge_date(self, date_raw: Any) -> Optional[datetime]:
+        """Parse a stored challenge date, assuming UTC if it has no timezone."""
+        if not isinstance(date_raw, str):
+            return None
+        parsed = dt_util.parse_datetime(date_raw)
+        if parsed and parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=dt_util.UTC)
+        return parsed
+
+    def _get_challenge_window(
+        self, challenge_id: str, challenge: dict[str, Any]
+    ) -> tuple[Optional[datetime], Optional[datetime]]:
+        """Return the parsed start and end dates of a challenge.
+
+        The parsed values are cached and reused until the stored strings change.
+        """
+        dates_raw = (challenge.get("start_date"), challenge.get("end_date"))
+        cached = self._challenge_windows.get(challenge_id)
+        if cached is not None and cached[0] == dates_raw:
+            return cached[1]
+
+        window = (
+            self._parse_challenge_date(dates_raw[0]),
+            self._parse_challenge_date(dates_raw[1]),
+        )
+        self._challenge_windows[challenge_id] = (dates_raw, window)
+        return window
+
     def _check_challenges_for_kid(self, kid_id: str):
         """Evaluate all challenge criteria for a given kid.
 
@@ -2504,17 +2501,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 continue
 
             # Check challenge window
-            start_date_raw = challenge.get("start_date")
-            if isinstance(start_date_raw, str):
-                start = dt_util.parse_datetime(start_date_raw)
-            else:
-                start = None
-
-            end_date_raw = challenge.get("end_date")
-            if isinstance(end_date_raw, str):
-                end = dt_util.parse_datetime(end_date_raw)
-            else:
-                end = None
+            start, end = self._get_challenge_window(challenge_id, challenge)
 
             if start and now < start:
                 continue
@@ -2537,8 +2524,6 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 )
 
                 required_daily = challenge.get("required_daily", 1)
-                start = dt_util.parse_datetime(challenge.get("start_date"))
-                end = dt_util.parse_datetime(challenge.get("end_date"))
                 if start and end:
                     num_days = (end - start).days + 1
                     # Verify for each day:
@@ -2578,24 +2563,25 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             self.update_kid_points(kid_id, new_points)
 
         # Notify kid and parents
+        challenge_name = challenge.get("name")
         extra_data = {"kid_id": kid_id, "challenge_id": challenge_id}
-        self.hass.async_create_task(
+        self._schedule_notification(
             self._notify_kid(
                 kid_id,
                 title="KidsChores: Challenge Completed",
-                message=f"You have completed the challenge: '{challenge.get('name')}'.",
+                message=f"You have completed the challenge: '{challenge_name}'.",
                 extra_data=extra_data,
             )
         )
-        self.hass.async_create_task(
+        self._schedule_notification(
             self._notify_parents(
                 kid_id,
                 title="KidsChores: Challenge Completed",
-                message=f"{self.kids_data[kid_id]['name']} has completed the challenge: '{challenge.get('name')}'.",
+                message=f"{kid_info['name']} has completed the challenge: '{challenge_name}'.",
                 extra_data=extra_data,
             )
         )
-        LOGGER.info("Awarded challenge '%s' to kid '%s'", challenge.get("name"), kid_id)
+        LOGGER.info("Awarded challenge '%s' to kid '%s'", challenge_name, kid_id)
         self._persist()
         self.async_set_updated_data(self._data)
 
@@ -2810,26 +2796,15 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 if notify:
                     kid_info["overdue_notifications"][chore_id] = now.isoformat()
                     extra_data = {"kid_id": kid_id, "chore_id": chore_id}
-                    actions = [
-                        {
-                            "action": f"{ACTION_APPROVE_CHORE}|{kid_id}|{chore_id}",
-                            "title": ACTION_TITLE_APPROVE,
-                        },
-                        {
-                            "action": f"{ACTION_DISAPPROVE_CHORE}|{kid_id}|{chore_id}",
-                            "title": ACTION_TITLE_DISAPPROVE,
-                        },
-                        {
-                            "action": f"{ACTION_REMIND_30}|{kid_id}|{chore_id}",
-                            "title": ACTION_TITLE_REMIND_30,
-                        },
-                    ]
+                    actions = build_approval_actions(
+                        CHORE_APPROVAL_ACTIONS, kid_id, chore_id
+                    )
                     LOGGER.debug(
                         "Sending overdue notification for chore '%s' to kid '%s'",
                         chore_id,
                         kid_id,
                     )
-                    self.hass.async_create_task(
+                    self._schedule_notification(
                         self._notify_kid(
                             kid_id,
                             title="KidsChores: Chore Overdue",
@@ -2837,7 +2812,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                             extra_data=extra_data,
                         )
                     )
-                    self.hass.async_create_task(
+                    self._schedule_notification(
                         self._notify_parents(
                             kid_id,
                             title="KidsChores: Chore Overdue",
@@ -2857,6 +2832,9 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         for kid in self.kids_data.values():
             kid["today_chore_approvals"] = {}
 
+        self._persist()
+        self.async_set_updated_data(self._data)
+
     async def _handle_recurring_chore_resets(self, now: datetime):
         """Handle recurring resets for daily, weekly, and monthly frequencies."""
 
@@ -3021,11 +2999,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         if freq == FREQUENCY_CUSTOM:
             custom_interval = chore_info.get("custom_interval")
             custom_unit = chore_info.get("custom_interval_unit")
-            if custom_interval is None or custom_unit not in [
-                "days",
-                "weeks",
-                "months",
-            ]:
+            if custom_interval is None or custom_unit not in CUSTOM_INTERVAL_UNITS:
                 LOGGER.warning(
                     "Custom frequency set but custom_interval or unit invalid for chore '%s'",
                     chore_info.get("name"),
@@ -3079,12 +3053,11 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 elif freq == FREQUENCY_MONTHLY:
                     next_due = self._add_months(next_due, 1)
                 elif freq == FREQUENCY_CUSTOM:
-                    if custom_unit == "days":
-                        next_due += timedelta(days=custom_interval)
-                    elif custom_unit == "weeks":
-                        next_due += timedelta(weeks=custom_interval)
-                    elif custom_unit == "months":
+                    if custom_unit == CONF_MONTHS:
                         next_due = self._add_months(next_due, custom_interval)
+                    else:
+                        unit_days = CUSTOM_INTERVAL_UNIT_DAYS[custom_unit]
+                        next_due += timedelta(days=custom_interval * unit_days)
             else:
                 # Next due is in the future but not on an applicable day,
                 # so just add one day until it falls on an applicable day.
@@ -3409,11 +3382,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
             ]
 
             # Remove open claims from pending approvals for this kid and reward.
-            self._data[DATA_PENDING_REWARD_APPROVALS] = [
-                ap
-                for ap in self._data[DATA_PENDING_REWARD_APPROVALS]
-                if not (ap["kid_id"] == kid_id and ap["reward_id"] == reward_id)
-            ]
+            self._remove_pending_reward_approvals(kid_id, reward_id)
 
         elif reward_id:
             # Reset a specific reward for all kids
@@ -3642,6 +3611,15 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                 blocking=True,
             )
 
+    def _schedule_notification(self, notification: Coroutine[Any, Any, None]) -> None:
+        """Send a notification in the background, without holding up the caller.
+
+        The task is tied to the config entry, so it is cancelled on unload.
+        """
+        self.config_entry.async_create_background_task(
+            self.hass, notification, name=f"{DOMAIN}_notification"
+        )
+
     async def _notify_kid(
         self,
         kid_id: str,
@@ -3684,6 +3662,32 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
         else:
             LOGGER.debug("No notification method configured for kid '%s'", kid_id)
 
+    async def _notify_kids(
+        self, kid_ids: list[str], chore_id: str, title: str, message: str
+    ) -> None:
+        """Send the same chore notification to several kids concurrently."""
+        results = await asyncio.gather(
+            *(
+                self._notify_kid(
+                    kid_id,
+                    title=title,
+                    message=message,
+                    extra_data={"kid_id": kid_id, "chore_id": chore_id},
+                )
+                for kid_id in kid_ids
+            ),
+            return_exceptions=True,
+        )
+        # One failed notification must not stop the others or go unnoticed
+        for kid_id, result in zip(kid_ids, results):
+            if isinstance(result, Exception):
+                LOGGER.error(
+                    "Failed to notify kid '%s' about chore '%s': %s",
+                    kid_id,
+                    chore_id,
+                    result,
+                )
+
     async def _notify_parents(
         self,
         kid_id: str,
@@ -3777,20 +3781,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                     chore_id,
                 )
                 return
-            actions = [
-                {
-                    "action": f"{ACTION_APPROVE_CHORE}|{kid_id}|{chore_id}",
-                    "title": ACTION_TITLE_APPROVE,
-                },
-                {
-                    "action": f"{ACTION_DISAPPROVE_CHORE}|{kid_id}|{chore_id}",
-                    "title": ACTION_TITLE_DISAPPROVE,
-                },
-                {
-                    "action": f"{ACTION_REMIND_30}|{kid_id}|{chore_id}",
-                    "title": ACTION_TITLE_REMIND_30,
-                },
-            ]
+            actions = build_approval_actions(CHORE_APPROVAL_ACTIONS, kid_id, chore_id)
             extra_data = {"kid_id": kid_id, "chore_id": chore_id}
             await self._notify_parents(
                 kid_id,
@@ -3809,20 +3800,7 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
                     kid_id,
                 )
                 return
-            actions = [
-                {
-                    "action": f"{ACTION_APPROVE_REWARD}|{kid_id}|{reward_id}",
-                    "title": ACTION_TITLE_APPROVE,
-                },
-                {
-                    "action": f"{ACTION_DISAPPROVE_REWARD}|{kid_id}|{reward_id}",
-                    "title": ACTION_TITLE_DISAPPROVE,
-                },
-                {
-                    "action": f"{ACTION_REMIND_30}|{kid_id}|{reward_id}",
-                    "title": ACTION_TITLE_REMIND_30,
-                },
-            ]
+            actions = build_approval_actions(REWARD_APPROVAL_ACTIONS, kid_id, reward_id)
             extra_data = {"kid_id": kid_id, "reward_id": reward_id}
             reward = self.rewards_data.get(reward_id, {})
             reward_name = reward.get("name", "the reward")
@@ -3844,9 +3822,9 @@ class KidsChoresDataCoordinator(DataUpdateCoordinator):
     # -------------------------------------------------------------------------------------
 
     def _persist(self):
-        """Save to persistent storage."""
+        """Save to persistent storage (coalesced with other pending writes)."""
         self.storage_manager.set_data(self._data)
-        self.hass.add_job(self.storage_manager.async_save)
+        self.storage_manager.async_delay_save()
 
     # -------------------------------------------------------------------------------------
     # Internal Helper for kid <-> name lookups
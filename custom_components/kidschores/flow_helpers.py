@@ -26,6 +26,7 @@ from .const import (
     CONF_NOTIFY_ON_DISAPPROVAL,
     CONF_POINTS_LABEL,
     CONF_POINTS_ICON,
+    CUSTOM_INTERVAL_UNIT_OPTIONS,
     DEFAULT_APPLICABLE_DAYS,
     DEFAULT_NOTIFY_ON_APPROVAL,
     DEFAULT_NOTIFY_ON_CLAIM,
@@ -250,7 +251,7 @@ def build_chore_schema(kids_dict, default=None):
                 None,
                 selector.SelectSelector(
                     selector.SelectSelectorConfig(
-                        options=["", "days", "weeks", "months"],
+                        options=list(CUSTOM_INTERVAL_UNIT_OPTIONS),
                         translation_key="custom_interval_unit",
                         multiple=False,
                         mode=selector.SelectSelectorMode.DROPDOWN,
@@ -17,6 +17,20 @@ from homeassistant.exceptions import HomeAssistantError
 from .const import DOMAIN, LOGGER
 
 
+def build_approval_actions(
+    approval_actions: tuple[tuple[str, str], ...], kid_id: str, item_id: str
+) -> list[dict[str, str]]:
+    """Build the actions for a chore or reward awaiting approval.
+
+    Each (action, title) pair becomes an action whose string carries the kid and
+    item IDs, e.g. "APPROVE_CHORE|<kid_id>|<chore_id>".
+    """
+    return [
+        {"action": f"{action}|{kid_id}|{item_id}", "title": title}
+        for action, title in approval_actions
+    ]
+
+
 async def async_send_notification(
     hass: HomeAssistant,
     notify_service: str,
@@ -32,6 +32,7 @@ Available Sensors:
 26. ChallengeProgressSensor ............ Progress (in %) toward a challenge per kid
 27. KidHighestStreakSensor ............. The highest current streak (in days) among streak-type achievements for a kid
 28.* ChoreStreakSensor .................. Current streak (in days) for a kid for a specific chore - DEPRECATE
+29. KidChoreStatusCountSensor .......... Number of a kid's chores in a given state (pending/claimed/approved/overdue)
 """
 
 from homeassistant.config_entries import ConfigEntry
@@ -63,6 +64,7 @@ from .const import (
     ATTR_CHORE_CURRENT_STREAK,
     ATTR_CHORE_HIGHEST_STREAK,
     ATTR_CHORE_NAME,
+    ATTR_CHORES,
     ATTR_COST,
     ATTR_CRITERIA,
     ATTR_CUSTOM_FREQUENCY_INTERVAL,
@@ -104,6 +106,7 @@ from .const import (
     CHORE_STATE_OVERDUE,
     CHORE_STATE_PENDING,
     CHORE_STATE_UNKNOWN,
+    CHORE_STATES_TRACKED,
     CONF_POINTS_ICON,
     CONF_POINTS_LABEL,
     DATA_PENDING_CHORE_APPROVALS,
@@ -126,7 +129,9 @@ from .const import (
     DOMAIN,
     DUE_DATE_NOT_SET,
     FREQUENCY_CUSTOM,
+    LABEL_CLAIMED_ON,
     LABEL_POINTS,
+    LABEL_REDEEMED_ON,
     REWARD_STATE_APPROVED,
     REWARD_STATE_CLAIMED,
     REWARD_STATE_NOT_CLAIMED,
@@ -312,6 +317,14 @@ async def async_setup_entry(
         # Highest Streak Sensor per Kid
         entities.append(KidHighestStreakSensor(coordinator, entry, kid_id, kid_name))
 
+        # Chore Status Count Sensors per Kid (one per tracked chore state)
+        for chore_state in CHORE_STATES_TRACKED:
+            entities.append(
+                KidChoreStatusCountSensor(
+                    coordinator, entry, kid_id, kid_name, chore_state
+                )
+            )
+
     # For each chore assigned to each kid, add a ChoreStatusSensor
     for chore_id, chore_info in coordinator.chores_data.items():
         chore_name = chore_info.get("name", f"Chore {chore_id}")
@@ -918,6 +931,8 @@ class PendingChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
                 {
                     ATTR_CHORE_NAME: chore_name,
                     ATTR_CLAIMED_ON: timestamp,
+                    # Deprecated key, kept so existing templates keep working
+                    LABEL_CLAIMED_ON: timestamp,
                 }
             )
 
@@ -967,6 +982,8 @@ class PendingRewardApprovalsSensor(CoordinatorEntity, SensorEntity):
                 {
                     ATTR_REWARD_NAME: reward_name,
                     ATTR_REDEEMED_ON: timestamp,
+                    # Deprecated key, kept so existing templates keep working
+                    LABEL_REDEEMED_ON: timestamp,
                 }
             )
 
@@ -2196,3 +2213,48 @@ class BonusAppliesSensor(CoordinatorEntity, SensorEntity):
         """Return the bonus's custom icon if set, else fallback."""
         bonus_info = self.coordinator.bonuses_data.get(self._bonus_id, {})
         return bonus_info.get("icon", DEFAULT_BONUS_ICON)
+
+
+# ------------------------------------------------------------------------------------------
+class KidChoreStatusCountSensor(CoordinatorEntity, SensorEntity):
+    """Sensor counting how many of a kid's chores are in a given state."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "kid_chore_status_count_sensor"
+
+    def __init__(self, coordinator, entry, kid_id, kid_name, chore_state):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._kid_id = kid_id
+        self._kid_name = kid_name
+        self._chore_state = chore_state
+        self._attr_unique_id = f"{entry.entry_id}_{kid_id}_{chore_state}_chore_count"
+        self._attr_translation_placeholders = {
+            "kid_name": kid_name,
+            "chore_state": chore_state,
+        }
+        self.entity_id = f"sensor.kc_{kid_name}_chores_{chore_state}"
+
+    def _get_chore_ids(self) -> list[str]:
+        """Return the chore IDs of this kid that are currently in this state."""
+        chores_by_state = self.coordinator.get_kid_chores_by_state(self._kid_id)
+        return chores_by_state.get(self._chore_state, [])
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of chores in this state."""
+        return len(self._get_chore_ids())
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Expose the names of the chores in this state."""
+        chore_names = [
+            self.coordinator.chores_data.get(chore_id, {}).get(
+                "name", f"Chore {chore_id}"
+            )
+            for chore_id in self._get_chore_ids()
+        ]
+        return {
+            ATTR_KID_NAME: self._kid_name,
+            ATTR_CHORES: chore_names,
+        }
@@ -23,6 +23,7 @@ from .const import (
     DATA_REWARDS,
     LOGGER,
     STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
     STORAGE_VERSION,
 )
 
@@ -160,6 +161,14 @@ class KidsChoresStorageManager:
         except Exception as e:
             LOGGER.error("Failed to save data to storage: %s", e)
 
+    def async_delay_save(self, delay: float = STORAGE_SAVE_DELAY) -> None:
+        """Schedule a save, coalescing all changes made within the delay into one write.
+
+        Must be called from the event loop. Pending writes are flushed on shutdown
+        by Store, and on unload by async_save.
+        """
+        self._store.async_delay_save(self.get_data, delay)
+
     async def async_clear_data(self):
         """Clear all stored data and reset to default structure."""
 
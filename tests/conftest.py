@@ -0,0 +1,12 @@
+"""Fixtures for KidsChores tests.
+
+Requires pytest-homeassistant-custom-component.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the custom integration in every test."""
+    yield
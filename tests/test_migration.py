@@ -0,0 +1,54 @@
+"""Tests for the stored data schema migration."""
+
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.kidschores.const import (
+    DATA_PENDING_CHORE_APPROVALS,
+    DATA_SCHEMA_VERSION,
+    DOMAIN,
+    SCHEMA_VERSION,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from custom_components.kidschores.coordinator import KidsChoresDataCoordinator
+from custom_components.kidschores.storage_manager import KidsChoresStorageManager
+
+
+async def test_v0_data_is_migrated_to_current_schema(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    """Data stored before schema_version existed is migrated and stamped."""
+    await hass.config.async_set_time_zone("UTC")
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {
+            DATA_PENDING_CHORE_APPROVALS: [
+                {
+                    "kid_id": "kid_1",
+                    "chore_id": "chore_1",
+                    "timestamp": "2024-01-01T08:00:00",
+                }
+            ],
+        },
+    }
+
+    entry = MockConfigEntry(domain=DOMAIN, options={})
+    entry.add_to_hass(hass)
+    storage_manager = KidsChoresStorageManager(hass, STORAGE_KEY)
+    await storage_manager.async_initialize()
+    coordinator = KidsChoresDataCoordinator(hass, entry, storage_manager)
+
+    with patch.object(DataUpdateCoordinator, "async_config_entry_first_refresh"):
+        await coordinator.async_config_entry_first_refresh()
+
+    data = storage_manager.get_data()
+    assert data[DATA_SCHEMA_VERSION] == SCHEMA_VERSION == 1
+    assert (
+        data[DATA_PENDING_CHORE_APPROVALS][0]["timestamp"]
+        == "2024-01-01T08:00:00+00:00"
+    )